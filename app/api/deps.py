@@ -1,19 +1,30 @@
+import asyncio
+import hmac
+import time
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, HTTPException, Security, status
+from fastapi.security import APIKeyHeader
 
-from app.core.config import Settings, get_settings
+from app.core.config import RUNTIME, Settings, get_settings, settings
 from app.core.exceptions import AuthenticationError
+from app.schemas.realestate import RealestateWebhook
+from app.schemas.response import WebhookResponse
 from app.services.message_formatter import MessageFormatter
 from app.services.telegram import TelegramService
 
+# Encoded once so key checks are a single constant-time compare
+_KEY_BYTES = RUNTIME.webhook_api_key.encode("utf-8")
 
-def get_api_key(
-    x_api_key: Annotated[str | None, Header()] = None,
-    settings: Settings = Depends(get_settings),
-) -> str:
-    """Validate and return the API key."""
+# Reads the raw header without Header()'s field processing, and registers
+# the security scheme in OpenAPI so /docs can authenticate
+_api_key_header = APIKeyHeader(name="X-Api-Key", auto_error=False)
+
+
+def get_api_key(x_api_key: Annotated[str | None, Security(_api_key_header)]) -> str:
+    """Validate and return the `X-Api-Key` header against the import-time settings."""
     if not x_api_key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -21,7 +32,7 @@ def get_api_key(
             headers={"WWW-Authenticate": "ApiKey"},
         )
 
-    if x_api_key != settings.WEBHOOK_API_KEY:
+    if not hmac.compare_digest(x_api_key.encode("utf-8"), _KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -48,6 +59,100 @@ def get_telegram_service() -> TelegramService:
     )
 
 
+# Shared by every endpoint that posts to Telegram
+TELEGRAM_SEM = asyncio.Semaphore(settings.TELEGRAM_MAX_CONCURRENCY)
+
+
+async def post_realestate_guarded(
+    telegram_service: TelegramService,
+    payload: RealestateWebhook,
+) -> WebhookResponse:
+    """
+    Post a listing while holding a slot of the global Telegram semaphore.
+
+    Raises a 503 if no slot frees up within TELEGRAM_ACQUIRE_TIMEOUT, rather
+    than letting requests pile up behind a saturated Telegram API.
+    """
+    try:
+        await asyncio.wait_for(
+            TELEGRAM_SEM.acquire(),
+            timeout=settings.TELEGRAM_ACQUIRE_TIMEOUT,
+        )
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Telegram posting is busy, retry later",
+        )
+
+    try:
+        return await telegram_service.post_realestate(payload)
+    finally:
+        TELEGRAM_SEM.release()
+
+
+async def post_realestate_queued(
+    telegram_service: TelegramService,
+    payload: RealestateWebhook,
+) -> WebhookResponse:
+    """
+    Post a queued listing under the global Telegram semaphore.
+
+    Waits for a slot with no timeout: the client was already told the
+    listing is queued, so there is no request to answer with a 503.
+    """
+    async with TELEGRAM_SEM:
+        return await telegram_service.post_realestate(payload)
+
+
+@dataclass(slots=True)
+class _HealthCache:
+    """Last Telegram health result and when it was taken (monotonic time)."""
+    checked_at: float = 0.0
+    healthy: bool | None = None
+
+    def get(self, ttl: float) -> bool | None:
+        """Return the cached result, or None if there is none or it expired."""
+        if self.healthy is None or time.monotonic() - self.checked_at >= ttl:
+            return None
+        return self.healthy
+
+
+_health_cache = _HealthCache()
+_health_lock = asyncio.Lock()
+
+
+async def cached_telegram_health(svc: TelegramService) -> bool:
+    """
+    Return the Telegram health status, re-checking at most once per TTL.
+
+    Only one check is in flight at a time. While it runs, concurrent callers
+    get the last known result; they only wait when there is none yet.
+    """
+    ttl = settings.HEALTH_CACHE_TTL
+    cached = _health_cache.get(ttl)
+    if cached is not None:
+        return cached
+
+    # A refresh is already in flight; don't queue behind its round-trip
+    if _health_lock.locked() and _health_cache.healthy is not None:
+        return _health_cache.healthy
+
+    async with _health_lock:
+        # Another caller may have refreshed the cache while we waited
+        cached = _health_cache.get(ttl)
+        if cached is not None:
+            return cached
+
+        try:
+            healthy = await svc.health_check()
+        except Exception:
+            healthy = False
+
+        _health_cache.healthy = healthy
+        _health_cache.checked_at = time.monotonic()
+        return healthy
+
+
 # Type aliases for dependency injection
 SettingsDep = Annotated[Settings, Depends(get_settings)]
 ApiKeyDep = Annotated[str, Depends(get_api_key)]
@@ -0,0 +1,67 @@
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import RUNTIME
+
+
+def _json_response(
+    status: int,
+    body: bytes,
+    *extra_headers: tuple[bytes, bytes],
+) -> tuple[Message, Message]:
+    """Build the pre-encoded ASGI start/body messages for a JSON response."""
+    start = {
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("ascii")),
+            *extra_headers,
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+# Probe responses mirror the bodies returned by the FastAPI health routes
+_READY = _json_response(200, b'{"status":"ready"}')
+_ALIVE = _json_response(200, b'{"status":"alive"}')
+_OK = _json_response(200, b'{"status":"ok"}')
+_METHOD_NOT_ALLOWED = _json_response(
+    405,
+    b'{"detail":"Method Not Allowed"}',
+    (b"allow", b"GET"),
+)
+
+PROBE_RESPONSES: dict[str, tuple[Message, Message]] = {
+    "/health": _OK,
+    "/health/ready": _READY,
+    "/health/live": _ALIVE,
+    f"{RUNTIME.api_v1_prefix}/health/ready": _READY,
+    f"{RUNTIME.api_v1_prefix}/health/live": _ALIVE,
+}
+PROBE_PATHS = frozenset(PROBE_RESPONSES)
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI wrapper that answers liveness/readiness probes directly.
+
+    Probe requests never reach the FastAPI stack, so they skip middleware,
+    exception handling, dependency resolution and response serialization.
+    Every other request (and the lifespan protocol) is passed through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in PROBE_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "GET":
+            start, body = PROBE_RESPONSES[scope["path"]]
+        else:
+            start, body = _METHOD_NOT_ALLOWED
+
+        await send(start)
+        await send(body)
@@ -0,0 +1,25 @@
+from typing import Any, Callable, Coroutine
+
+import orjson
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+
+
+class ORJSONRoute(APIRoute):
+    """API route that parses JSON request bodies with orjson."""
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        original_route_handler = super().get_route_handler()
+
+        async def custom_route_handler(request: Request) -> Response:
+            body = await request.body()
+            if body:
+                try:
+                    # Starlette's Request.json() returns the cached `_json` if present
+                    request._json = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    # Leave malformed bodies to FastAPI so it reports the usual 422
+                    pass
+            return await original_route_handler(request)
+
+        return custom_route_handler
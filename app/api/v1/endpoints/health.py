@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
-from app.api.deps import SettingsDep, TelegramServiceDep
+from app.api.deps import SettingsDep, TelegramServiceDep, cached_telegram_health
+from app.core.responses import ORJSONResponse
 from app.schemas.response import HealthResponse
 
 router = APIRouter()
@@ -9,6 +10,7 @@ router = APIRouter()
 @router.get(
     "",
     response_model=HealthResponse,
+    response_class=ORJSONResponse,
     summary="Health check",
     description="Check the health status of the application and its dependencies.",
 )
@@ -27,11 +29,8 @@ async def health_check(
         "configuration": True,
     }
 
-    # Check Telegram bot
-    try:
-        checks["telegram_bot"] = await telegram_service.health_check()
-    except Exception:
-        checks["telegram_bot"] = False
+    # Check Telegram bot (cached to avoid hammering the API from probes)
+    checks["telegram_bot"] = await cached_telegram_health(telegram_service)
 
     # Determine overall status
     all_healthy = all(checks.values())
@@ -46,6 +45,8 @@ async def health_check(
 
 @router.get(
     "/ready",
+    response_model=None,
+    response_class=ORJSONResponse,
     summary="Readiness check",
     description="Check if the application is ready to receive traffic.",
 )
@@ -56,6 +57,8 @@ async def readiness_check() -> dict[str, str]:
 
 @router.get(
     "/live",
+    response_model=None,
+    response_class=ORJSONResponse,
     summary="Liveness check",
     description="Check if the application is alive.",
 )
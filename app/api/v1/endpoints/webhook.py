@@ -1,13 +1,24 @@
-from fastapi import APIRouter, BackgroundTasks
+import asyncio
 
-from app.api.deps import ApiKeyDep, TelegramServiceDep
+from fastapi import APIRouter, HTTPException, Request, status
+
+from app.api.deps import ApiKeyDep, TelegramServiceDep, post_realestate_guarded
+from app.api.orjson_route import ORJSONRoute
+from app.core.config import RUNTIME
 from app.core.logging import get_logger
 from app.schemas.realestate import RealestateWebhook
-from app.schemas.response import WebhookResponse, WebhookStatus
+from app.schemas.response import WebhookResponse
+from app.services.rate_limiter import RateLimiter
 
-router = APIRouter()
+# Parse webhook bodies with orjson. include_router keeps each route's own
+# class, so this has to be set on the router that declares the routes
+router = APIRouter(route_class=ORJSONRoute)
 logger = get_logger(__name__)
 
+# Bounds concurrent batch posts across all batch requests
+_batch_semaphore = asyncio.Semaphore(RUNTIME.batch_concurrency)
+_rate_limiter = RateLimiter(RUNTIME.batch_min_interval_ms / 1000)
+
 
 @router.post(
     "/realestate",
@@ -20,6 +31,7 @@ logger = get_logger(__name__)
         422: {"description": "Validation error"},
         429: {"description": "Rate limited by Telegram"},
         502: {"description": "Telegram API error"},
+        503: {"description": "Telegram posting is busy"},
     },
 )
 async def handle_realestate_webhook(
@@ -39,9 +51,9 @@ async def handle_realestate_webhook(
     which Telegram channel to post to. If no channel is configured
     for the city, the webhook will be skipped.
     """
-    logger.info(f"Received webhook for realestate {payload.id} in city {payload.city_id}")
+    logger.info("Received webhook for realestate %s in city %s", payload.id, payload.city_id)
 
-    result = await telegram_service.post_realestate(payload)
+    result = await post_realestate_guarded(telegram_service, payload)
 
     return result
 
@@ -51,34 +63,40 @@ async def handle_realestate_webhook(
     response_model=WebhookResponse,
     summary="Post real estate to Telegram (async)",
     description="Queue a real estate listing to be posted to Telegram asynchronously.",
+    responses={
+        503: {"description": "Posting queue is full"},
+    },
 )
 async def handle_realestate_webhook_async(
+    request: Request,
     payload: RealestateWebhook,
     _api_key: ApiKeyDep,
     telegram_service: TelegramServiceDep,
-    background_tasks: BackgroundTasks,
 ) -> WebhookResponse:
     """
     Handle incoming real estate webhook asynchronously.
 
-    This endpoint queues the real estate posting as a background task,
-    allowing for faster response times. Use this for non-critical
-    notifications where immediate confirmation isn't required.
+    This endpoint puts the real estate posting on a bounded queue that
+    is drained by background workers, allowing for faster response times.
+    Use this for non-critical notifications where immediate confirmation
+    isn't required.
 
     **Authentication**: Requires `X-Api-Key` header.
-    """
-    logger.info(f"Queuing async webhook for realestate {payload.id}")
 
-    async def post_task() -> None:
-        try:
-            await telegram_service.post_realestate(payload)
-        except Exception as e:
-            logger.error(f"Background task failed for {payload.id}: {e}")
+    **Back-pressure**: Returns 503 when the queue is full.
+    """
+    logger.info("Queuing async webhook for realestate %s", payload.id)
 
-    background_tasks.add_task(post_task)
+    try:
+        request.app.state.post_queue.put_nowait((telegram_service, payload))
+    except asyncio.QueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Posting queue is full, retry later",
+        )
 
     return WebhookResponse(
-        status=WebhookStatus.QUEUED,
+        status="queued",
         message="Webhook queued for processing",
     )
 
@@ -99,18 +117,27 @@ async def handle_realestate_batch_webhook(
 
     This endpoint receives multiple real estate listings and posts them
     to their corresponding Telegram channels. Each listing is processed
-    independently, so failures in one won't affect others.
+    independently, so failures in one won't affect others. Listings are
+    posted concurrently (up to `BATCH_CONCURRENCY` at a time), spaced at
+    least `BATCH_MIN_INTERVAL_MS` apart.
 
     **Authentication**: Requires `X-Api-Key` header.
 
     **Rate Limiting**: Be mindful of Telegram's rate limits when using
     batch endpoints. Consider using the async endpoint for large batches.
     """
-    logger.info(f"Received batch webhook with {len(payloads)} items")
-
-    results = []
-    for payload in payloads:
-        result = await telegram_service.post_realestate(payload)
-        results.append(result)
-
-    return results
+    logger.info("Received batch webhook with %d items", len(payloads))
+
+    async def post_one(payload: RealestateWebhook) -> WebhookResponse:
+        async with _batch_semaphore:
+            await _rate_limiter.tick()
+            try:
+                return await post_realestate_guarded(telegram_service, payload)
+            except Exception as e:
+                logger.error("Batch item %s failed: %s", payload.id, e)
+                return WebhookResponse(
+                    status="failed",
+                    message=str(e),
+                )
+
+    return list(await asyncio.gather(*(post_one(payload) for payload in payloads)))
@@ -1,3 +1,6 @@
+import os
+import sys
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Any
 
@@ -40,24 +43,44 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
     LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+    # Server
+    THREADPOOL_SIZE: int = Field(default_factory=lambda: min(32, (os.cpu_count() or 1) * 2))
+
     # Rate limiting
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_PERIOD: int = 60  # seconds
 
+    # Telegram concurrency (stays below Telegram's ~30 msg/s per-bot limit)
+    TELEGRAM_MAX_CONCURRENCY: int = 20
+    TELEGRAM_ACQUIRE_TIMEOUT: float = 5.0  # seconds to wait for a free slot
+    TELEGRAM_POOL_SIZE: int = 32  # pooled HTTP connections to the Bot API
+
+    # Batch processing
+    BATCH_CONCURRENCY: int = 8
+    BATCH_MIN_INTERVAL_MS: int = 40  # keeps batches under Telegram's ~30 msg/s
+
+    # Async posting queue
+    POST_QUEUE_SIZE: int = 1024
+    POST_QUEUE_DRAIN_TIMEOUT: float = 10.0  # seconds
+
     # Retry configuration
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0  # seconds
 
+    # Health check
+    HEALTH_CACHE_TTL: float = 5.0  # seconds
+
     @field_validator("CITY_CHANNELS", mode="before")
     @classmethod
     def parse_city_channels(cls, v: Any) -> dict[int, str]:
         """Parse city channels from JSON string or dict."""
+        # Channel IDs are interned so downstream comparisons are identity checks
         if isinstance(v, str):
             import json
             parsed = json.loads(v)
-            return {int(k): str(val) for k, val in parsed.items()}
+            return {int(k): sys.intern(str(val)) for k, val in parsed.items()}
         if isinstance(v, dict):
-            return {int(k): str(val) for k, val in v.items()}
+            return {int(k): sys.intern(str(val)) for k, val in v.items()}
         return v
 
     @model_validator(mode="after")
@@ -78,4 +101,37 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@dataclass(slots=True, frozen=True)
+class RuntimeSettings:
+    """Immutable snapshot of the settings read on request hot paths."""
+
+    webhook_api_key: str
+    bot_token: str
+    city_channels: dict[int, str]
+    environment: str
+    app_version: str
+    log_level: str
+    log_format: str
+    api_v1_prefix: str
+    batch_concurrency: int
+    batch_min_interval_ms: int
+
+
 settings = get_settings()
+
+# Plain dict copy of the city mapping for direct lookups on the posting path
+CITY_CHANNELS_MAP: dict[int, str] = dict(settings.CITY_CHANNELS)
+
+# Slotted attribute access is cheaper than going through the Pydantic model
+RUNTIME = RuntimeSettings(
+    webhook_api_key=settings.WEBHOOK_API_KEY,
+    bot_token=settings.BOT_TOKEN,
+    city_channels=CITY_CHANNELS_MAP,
+    environment=settings.ENVIRONMENT,
+    app_version=settings.APP_VERSION,
+    log_level=settings.LOG_LEVEL,
+    log_format=settings.LOG_FORMAT,
+    api_v1_prefix=settings.API_V1_PREFIX,
+    batch_concurrency=settings.BATCH_CONCURRENCY,
+    batch_min_interval_ms=settings.BATCH_MIN_INTERVAL_MS,
+)
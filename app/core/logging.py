@@ -17,10 +17,21 @@ class ColoredFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Color-wrapped level names, built once instead of per record
+        self._colored = {
+            level: f"{color}{level}{self.RESET}" for level, color in self.COLORS.items()
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        color = self.COLORS.get(record.levelname, self.RESET)
-        record.levelname = f"{color}{record.levelname}{self.RESET}"
-        return super().format(record)
+        # Restore the level name so other handlers don't see the color codes
+        original = record.levelname
+        record.levelname = self._colored.get(original, original)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = original
 
 
 def setup_logging() -> None:
@@ -1,61 +1,119 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import __version__
+from app.api.deps import post_realestate_queued
+from app.api.health_interceptor import HealthCheckInterceptor
 from app.api.v1.router import api_router
 from app.core.config import settings
 from app.core.logging import get_logger, setup_logging
+from app.core.responses import ORJSONResponse
 from app.middleware.error_handler import setup_exception_handlers
 from app.middleware.logging import LoggingMiddleware
+from app.schemas.realestate import RealestateWebhook
+from app.services.telegram import TelegramService
 
 # Setup logging early
 setup_logging()
 logger = get_logger(__name__)
 
+_APP_DESCRIPTION = """
+## Baity Telegram Bot API
+
+A webhook service for posting real estate listings to city-specific Telegram channels.
+
+### Features
+- Receive real estate webhooks from Baity backend
+- Post listings to configured Telegram channels
+- Support for photos and formatted messages
+- Batch and async processing options
+
+### Authentication
+All webhook endpoints require an `X-Api-Key` header.
+"""
+
+
+async def _post_worker(
+    queue: asyncio.Queue[tuple[TelegramService, RealestateWebhook]],
+) -> None:
+    """Post listings queued by the async webhook endpoint."""
+    while True:
+        telegram_service, payload = await queue.get()
+        try:
+            await post_realestate_queued(telegram_service, payload)
+        except Exception as e:
+            logger.exception("Queued post failed for %s: %s", payload.id, e)
+        finally:
+            queue.task_done()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
     # Startup
-    logger.info(f"Starting {settings.APP_NAME} v{__version__}")
-    logger.info(f"Environment: {settings.ENVIRONMENT}")
-    logger.info(f"Debug mode: {settings.DEBUG}")
-    logger.info(f"Configured channels: {len(settings.CITY_CHANNELS)}")
+    logger.info("Starting %s v%s", settings.APP_NAME, __version__)
+    logger.info("Environment: %s", settings.ENVIRONMENT)
+    logger.info("Debug mode: %s", settings.DEBUG)
+    logger.info("Configured channels: %d", len(settings.CITY_CHANNELS))
+
+    # Bound the thread pools used for sync dependencies and run_in_executor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.THREADPOOL_SIZE),
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+
+    post_queue: asyncio.Queue[tuple[TelegramService, RealestateWebhook]] = asyncio.Queue(
+        maxsize=settings.POST_QUEUE_SIZE,
+    )
+    app.state.post_queue = post_queue
+    workers = [
+        asyncio.create_task(_post_worker(post_queue))
+        for _ in range(settings.BATCH_CONCURRENCY)
+    ]
 
     yield
 
     # Shutdown
     logger.info("Shutting down application")
 
+    # Let queued posts finish (bounded), then stop the workers
+    try:
+        await asyncio.wait_for(post_queue.join(), timeout=settings.POST_QUEUE_DRAIN_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning("Dropping %d queued posts on shutdown", post_queue.qsize())
+    for worker in workers:
+        worker.cancel()
+    await asyncio.gather(*workers, return_exceptions=True)
+
 
 def create_application() -> FastAPI:
     """Application factory."""
     app = FastAPI(
         title=settings.APP_NAME,
         version=__version__,
-        description="""
-## Baity Telegram Bot API
-
-A webhook service for posting real estate listings to city-specific Telegram channels.
-
-### Features
-- Receive real estate webhooks from Baity backend
-- Post listings to configured Telegram channels
-- Support for photos and formatted messages
-- Batch and async processing options
-
-### Authentication
-All webhook endpoints require an `X-Api-Key` header.
-        """,
+        description=_APP_DESCRIPTION,
         docs_url="/docs" if settings.DEBUG else None,
         redoc_url="/redoc" if settings.DEBUG else None,
         openapi_url="/openapi.json" if settings.DEBUG else None,
+        default_response_class=ORJSONResponse,
         lifespan=lifespan,
     )
 
+    # Docs are disabled outside debug; never build the route schema either
+    if not settings.DEBUG:
+        app.openapi = lambda: {  # type: ignore[method-assign]
+            "openapi": "3.1.0",
+            "info": {"title": settings.APP_NAME, "version": __version__},
+            "paths": {},
+        }
+
     # Setup exception handlers
     setup_exception_handlers(app)
 
@@ -95,7 +153,10 @@ All webhook endpoints require an `X-Api-Key` header.
 
 
 # Create the application instance
-app = create_application()
+fastapi_app = create_application()
+
+# Probes are answered before the request reaches the FastAPI stack
+app = HealthCheckInterceptor(fastapi_app)
 
 
 if __name__ == "__main__":
@@ -107,4 +168,7 @@ if __name__ == "__main__":
         port=8000,
         reload=settings.DEBUG,
         log_level=settings.LOG_LEVEL.lower(),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
     )
@@ -1,9 +1,10 @@
-from datetime import datetime
+import logging
+from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import FastAPI, Request
+import orjson
+from fastapi import FastAPI, Request, Response
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
-from pydantic import ValidationError
 
 from app.core.exceptions import (
     AuthenticationError,
@@ -14,10 +15,51 @@ from app.core.exceptions import (
     TelegramRateLimitError,
 )
 from app.core.logging import get_logger
-from app.schemas.response import ErrorDetail, ErrorResponse
 
 logger = get_logger(__name__)
 
+# Exception type -> (error code, HTTP status, log level)
+_EXC_TABLE: dict[type[BaityBotException], tuple[str, int, int]] = {
+    AuthenticationError: ("authentication_error", 401, logging.WARNING),
+    ChannelNotFoundError: ("channel_not_found", 404, logging.INFO),
+    TelegramRateLimitError: ("rate_limited", 429, logging.WARNING),
+    TelegramError: ("telegram_error", 502, logging.ERROR),
+    ConfigurationError: ("configuration_error", 500, logging.ERROR),
+}
+_DEFAULT_ENTRY = ("application_error", 500, logging.ERROR)
+
+
+def _lookup(exc_type: type[BaityBotException]) -> tuple[str, int, int]:
+    """Find the table entry for an exception type or its nearest base class."""
+    entry = _EXC_TABLE.get(exc_type)
+    if entry is not None:
+        return entry
+    for base in exc_type.__mro__[1:]:
+        entry = _EXC_TABLE.get(base)
+        if entry is not None:
+            return entry
+    return _DEFAULT_ENTRY
+
+
+def _err(
+    error: str,
+    message: str,
+    request_id: str | None,
+    details: list[dict[str, Any]] | None = None,
+) -> bytes:
+    """Encode an ErrorResponse-shaped body without building the model."""
+    return orjson.dumps(
+        {
+            "error": error,
+            "message": message,
+            "details": details,
+            "timestamp": datetime.now(UTC),
+            "request_id": request_id,
+        },
+        # Same "...Z" form pydantic uses for the response models
+        option=orjson.OPT_UTC_Z,
+    )
+
 
 def setup_exception_handlers(app: FastAPI) -> None:
     """Setup global exception handlers for the application."""
@@ -26,159 +68,65 @@ def setup_exception_handlers(app: FastAPI) -> None:
     async def validation_exception_handler(
         request: Request,
         exc: RequestValidationError,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle request validation errors."""
         request_id = getattr(request.state, "request_id", None)
-        details = [
-            ErrorDetail(
-                field=".".join(str(loc) for loc in error["loc"]),
-                message=error["msg"],
-                code=error["type"],
-            )
-            for error in exc.errors()
-        ]
-
-        response = ErrorResponse(
-            error="validation_error",
-            message="Request validation failed",
-            details=details,
-            request_id=request_id,
-        )
-
-        logger.warning(f"Validation error: {exc.errors()}")
-        return JSONResponse(
+        errors = exc.errors()
+        # Plain dicts in the ErrorDetail shape, encoded in the same orjson pass
+        body = _err(
+            "validation_error",
+            "Request validation failed",
+            request_id,
+            details=[
+                {
+                    "field": ".".join(map(str, error["loc"])),
+                    "message": error["msg"],
+                    "code": error["type"],
+                }
+                for error in errors
+            ],
+        )
+
+        logger.warning("Validation error: %s", errors)
+        return Response(
+            content=body,
             status_code=422,
-            content=response.model_dump(mode="json"),
-        )
-
-    @app.exception_handler(AuthenticationError)
-    async def authentication_exception_handler(
-        request: Request,
-        exc: AuthenticationError,
-    ) -> JSONResponse:
-        """Handle authentication errors."""
-        request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="authentication_error",
-            message=exc.message,
-            request_id=request_id,
-        )
-
-        logger.warning(f"Authentication error: {exc.message}")
-        return JSONResponse(
-            status_code=401,
-            content=response.model_dump(mode="json"),
-        )
-
-    @app.exception_handler(ChannelNotFoundError)
-    async def channel_not_found_exception_handler(
-        request: Request,
-        exc: ChannelNotFoundError,
-    ) -> JSONResponse:
-        """Handle channel not found errors."""
-        request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="channel_not_found",
-            message=exc.message,
-            request_id=request_id,
-        )
-
-        return JSONResponse(
-            status_code=404,
-            content=response.model_dump(mode="json"),
-        )
-
-    @app.exception_handler(TelegramRateLimitError)
-    async def telegram_rate_limit_exception_handler(
-        request: Request,
-        exc: TelegramRateLimitError,
-    ) -> JSONResponse:
-        """Handle Telegram rate limit errors."""
-        request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="rate_limited",
-            message=exc.message,
-            request_id=request_id,
-        )
-
-        return JSONResponse(
-            status_code=429,
-            content=response.model_dump(mode="json"),
-            headers={"Retry-After": str(exc.retry_after)},
-        )
-
-    @app.exception_handler(TelegramError)
-    async def telegram_exception_handler(
-        request: Request,
-        exc: TelegramError,
-    ) -> JSONResponse:
-        """Handle Telegram errors."""
-        request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="telegram_error",
-            message=exc.message,
-            request_id=request_id,
-        )
-
-        logger.error(f"Telegram error: {exc.message}")
-        return JSONResponse(
-            status_code=502,
-            content=response.model_dump(mode="json"),
-        )
-
-    @app.exception_handler(ConfigurationError)
-    async def configuration_exception_handler(
-        request: Request,
-        exc: ConfigurationError,
-    ) -> JSONResponse:
-        """Handle configuration errors."""
-        request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="configuration_error",
-            message=exc.message,
-            request_id=request_id,
-        )
-
-        logger.error(f"Configuration error: {exc.message}")
-        return JSONResponse(
-            status_code=500,
-            content=response.model_dump(mode="json"),
+            media_type="application/json",
         )
 
     @app.exception_handler(BaityBotException)
     async def baity_bot_exception_handler(
         request: Request,
         exc: BaityBotException,
-    ) -> JSONResponse:
-        """Handle general application errors."""
+    ) -> Response:
+        """Handle application errors, dispatching on the exception type."""
+        error, status_code, log_level = _lookup(type(exc))
         request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="application_error",
-            message=exc.message,
-            request_id=request_id,
-        )
+        body = _err(error, exc.message, request_id)
 
-        logger.error(f"Application error: {exc.message}")
-        return JSONResponse(
-            status_code=500,
-            content=response.model_dump(mode="json"),
+        logger.log(log_level, "Application error (%s): %s", error, exc.message)
+        headers = None
+        if isinstance(exc, TelegramRateLimitError):
+            headers = {"Retry-After": str(exc.retry_after)}
+        return Response(
+            content=body,
+            status_code=status_code,
+            media_type="application/json",
+            headers=headers,
         )
 
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request,
         exc: Exception,
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle unexpected errors."""
         request_id = getattr(request.state, "request_id", None)
-        response = ErrorResponse(
-            error="internal_error",
-            message="An unexpected error occurred",
-            request_id=request_id,
-        )
+        body = _err("internal_error", "An unexpected error occurred", request_id)
 
-        logger.exception(f"Unexpected error: {exc}")
-        return JSONResponse(
+        logger.exception("Unexpected error: %s", exc)
+        return Response(
+            content=body,
             status_code=500,
-            content=response.model_dump(mode="json"),
+            media_type="application/json",
         )
@@ -1,14 +1,26 @@
+import logging
+import os
 import time
-import uuid
 from typing import Callable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.config import RUNTIME
 from app.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Probe and health endpoints are polled constantly and are not worth logging
+_HEALTH_PATHS = frozenset({
+    "/health",
+    "/health/ready",
+    "/health/live",
+    f"{RUNTIME.api_v1_prefix}/health",
+    f"{RUNTIME.api_v1_prefix}/health/ready",
+    f"{RUNTIME.api_v1_prefix}/health/live",
+})
+
 
 class LoggingMiddleware(BaseHTTPMiddleware):
     """Middleware for request/response logging."""
@@ -18,15 +30,23 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         request: Request,
         call_next: Callable,
     ) -> Response:
+        path = request.url.path
+        if path in _HEALTH_PATHS:
+            return await call_next(request)
+
         # Generate request ID
-        request_id = str(uuid.uuid4())[:8]
+        request_id = os.urandom(4).hex()
         request.state.request_id = request_id
 
         # Log request
         start_time = time.perf_counter()
-        logger.info(
-            f"[{request_id}] {request.method} {request.url.path} - Started"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] %s %s - Started",
+                request_id,
+                request.method,
+                path,
+            )
 
         # Process request
         try:
@@ -35,8 +55,12 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Log error
             process_time = (time.perf_counter() - start_time) * 1000
             logger.error(
-                f"[{request_id}] {request.method} {request.url.path} - "
-                f"Error after {process_time:.2f}ms: {e}"
+                "[%s] %s %s - Error after %.2fms: %s",
+                request_id,
+                request.method,
+                path,
+                process_time,
+                e,
             )
             raise
 
@@ -48,9 +72,14 @@ class LoggingMiddleware(BaseHTTPMiddleware):
         response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
 
         # Log response
-        logger.info(
-            f"[{request_id}] {request.method} {request.url.path} - "
-            f"{response.status_code} ({process_time:.2f}ms)"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[%s] %s %s - %d (%.2fms)",
+                request_id,
+                request.method,
+                path,
+                response.status_code,
+                process_time,
+            )
 
         return response
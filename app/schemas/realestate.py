@@ -1,7 +1,7 @@
 from enum import Enum
-from typing import Annotated
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, model_validator
 
 
 class OfferType(str, Enum):
@@ -10,6 +10,13 @@ class OfferType(str, Enum):
     RENT = "RENT"
     CHALET = "CHALET"
 
+    @classmethod
+    def _missing_(cls, value: object) -> "OfferType | None":
+        """Match offer types case-insensitively."""
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
 
 class Currency(str, Enum):
     """Supported currencies."""
@@ -32,8 +39,11 @@ class RealestateWebhook(BaseModel):
     subdistrict_name: Annotated[str, Field(min_length=1, description="Subdistrict name")]
     category: Annotated[str, Field(min_length=1, description="Category name")]
     subcategory: Annotated[str, Field(min_length=1, description="Subcategory name")]
-    images: Annotated[list[str], Field(default_factory=list, description="Image URLs")]
-    offer_type: Annotated[str, Field(description="Offer type (SELL, RENT, CHALET)")] = "SELL"
+    images: Annotated[tuple[HttpUrl, ...], Field(default_factory=tuple, description="Image URLs")]
+    offer_type: Annotated[
+        OfferType,
+        Field(validate_default=True, description="Offer type (SELL, RENT, CHALET)"),
+    ] = OfferType.SELL
     phone: Annotated[str | None, Field(max_length=20, description="Contact phone number")] = None
     url: Annotated[str, Field(description="Deep link to listing")]
     # Additional specs
@@ -44,24 +54,23 @@ class RealestateWebhook(BaseModel):
     frontage_width: Annotated[float | None, Field(description="Frontage width in meters")] = None
     frontage_depth: Annotated[float | None, Field(description="Frontage depth in meters")] = None
 
-    @field_validator("images", mode="before")
-    @classmethod
-    def validate_images(cls, v: list[str] | None) -> list[str]:
-        """Ensure images is always a list."""
-        if v is None:
-            return []
-        return [img for img in v if img and isinstance(img, str)]
-
-    @field_validator("offer_type", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def normalize_offer_type(cls, v: str) -> str:
-        """Normalize offer type to uppercase."""
-        if isinstance(v, str):
-            return v.upper()
-        return v
+    def drop_empty_images(cls, data: Any) -> Any:
+        """Treat a null image list as empty and drop blank entries."""
+        if isinstance(data, dict) and "images" in data:
+            images = data["images"]
+            if images is None:
+                data = {**data, "images": []}
+            elif isinstance(images, list) and not all(images):
+                data = {**data, "images": [img for img in images if img]}
+        return data
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        use_enum_values=True,
+        json_schema_extra={
             "example": {
                 "id": "abc123xyz",
                 "title": "Modern Apartment in Baghdad",
@@ -80,4 +89,5 @@ class RealestateWebhook(BaseModel):
                 "phone": "+964123456789",
                 "url": "https://ibaity.com/realestate/abc123xyz"
             }
-        }
+        },
+    )
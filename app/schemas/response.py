@@ -1,16 +1,18 @@
-from datetime import datetime
-from enum import Enum
-from typing import Any, Generic, TypeVar
+from datetime import UTC, datetime
+from typing import Generic, Literal, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+DataT = TypeVar("DataT")
+
+
+def _utcnow() -> datetime:
+    """Timezone-aware UTC timestamp for response models."""
+    return datetime.now(UTC)
 
 
-class WebhookStatus(str, Enum):
-    """Status of webhook processing."""
-    POSTED = "posted"
-    SKIPPED = "skipped"
-    FAILED = "failed"
-    QUEUED = "queued"
+# Status of webhook processing
+WebhookStatus = Literal["posted", "skipped", "failed", "queued"]
 
 
 class WebhookResponse(BaseModel):
@@ -19,10 +21,10 @@ class WebhookResponse(BaseModel):
     message: str | None = None
     message_id: int | None = Field(default=None, description="Telegram message ID if posted")
     channel_id: str | None = Field(default=None, description="Target channel ID")
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "posted",
                 "message": "Successfully posted to Telegram",
@@ -30,7 +32,8 @@ class WebhookResponse(BaseModel):
                 "channel_id": "@baghdad_realestate",
                 "timestamp": "2024-01-15T10:30:00Z"
             }
-        }
+        },
+    )
 
 
 class HealthResponse(BaseModel):
@@ -38,11 +41,11 @@ class HealthResponse(BaseModel):
     status: str = "ok"
     version: str
     environment: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     checks: dict[str, bool] = Field(default_factory=dict)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "status": "ok",
                 "version": "1.0.0",
@@ -53,7 +56,8 @@ class HealthResponse(BaseModel):
                     "configuration": True
                 }
             }
-        }
+        },
+    )
 
 
 class ErrorDetail(BaseModel):
@@ -68,11 +72,11 @@ class ErrorResponse(BaseModel):
     error: str
     message: str
     details: list[ErrorDetail] | None = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
     request_id: str | None = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "error": "validation_error",
                 "message": "Request validation failed",
@@ -82,15 +86,13 @@ class ErrorResponse(BaseModel):
                 "timestamp": "2024-01-15T10:30:00Z",
                 "request_id": "req_abc123"
             }
-        }
-
-
-DataT = TypeVar("DataT")
+        },
+    )
 
 
-class ApiResponse(BaseModel, Generic[TypeVar("DataT")]):
+class ApiResponse(BaseModel, Generic[DataT]):
     """Generic API response wrapper."""
     success: bool
-    data: Any | None = None
+    data: DataT | None = None
     error: ErrorResponse | None = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: datetime = Field(default_factory=_utcnow)
@@ -0,0 +1,10 @@
+# Cython declarations for compiling message_formatter.py in pure-Python mode.
+# Only used when building with BAITY_ENABLE_CYTHON=1 (see setup.py); the .py
+# module stays the source of truth and runs unchanged without Cython.
+
+cdef class MessageFormatter:
+    cdef public int max_description_length
+    cdef public bint include_phone
+    cdef public object _offer_get
+
+    cpdef str format(self, object data)
@@ -11,6 +11,8 @@ class FormatterProtocol(Protocol):
         ...
 
 
+# Not a Numba candidate: string-heavy code only runs in object mode and is
+# slower than CPython. Use the optional Cython build instead (perf/README.md).
 class MessageFormatter:
     """Formats real estate data for Telegram messages."""
 
@@ -28,49 +30,43 @@ class MessageFormatter:
     ) -> None:
         self.max_description_length = max_description_length
         self.include_phone = include_phone
+        # Bound once; offer types arrive upper-cased from the OfferType enum
+        self._offer_get = self.OFFER_TYPE_ICONS.get
 
     def format(self, data: RealestateWebhook) -> str:
         """Format real estate data into a Telegram message."""
-        parts = [
-            self._format_title(data.title),
-            "",
-            self._format_location(data),
-            self._format_specs(data),
-            self._format_price(data.price, data.currency),
-        ]
-
-        if data.description:
-            parts.extend(["", self._format_description(data.description)])
-
-        parts.extend([
-            "",
-            self._format_category(data.category, data.subcategory),
-            self._format_offer_type(data.offer_type),
-        ])
-
-        if self.include_phone and data.phone:
-            parts.append(self._format_phone(data.phone))
-
-        parts.extend(["", self._format_link(data.url)])
-
-        return "\n".join(parts)
-
-    def _format_title(self, title: str) -> str:
-        """Format the listing title."""
-        # Escape HTML special characters
-        escaped = self._escape_html(title)
-        return f"<b>{escaped}</b>"
+        # Assembled inline; only _format_price is overridden by subclasses
+        esc = self._escape_html
+        offer_type = data.offer_type
 
-    def _format_location(self, data: RealestateWebhook) -> str:
-        """Format location information."""
         location = f"{data.city_name}, {data.district_name}"
         if data.subdistrict_name and data.subdistrict_name != data.district_name:
             location += f", {data.subdistrict_name}"
-        return f"{location}"
 
-    def _format_specs(self, data: RealestateWebhook) -> str:
-        """Format specifications."""
-        return f"{data.area:,.0f} m²"
+        desc = data.description
+        if desc:
+            desc = esc(desc)
+            maxlen = self.max_description_length
+            if len(desc) > maxlen:
+                desc = desc[:maxlen].rsplit(" ", 1)[0] + "..."
+
+        phone = data.phone if self.include_phone else None
+
+        # One list literal; optional lines are unpacked in place
+        return "\n".join([
+            f"<b>{esc(data.title)}</b>",
+            "",
+            location,
+            f"{data.area:,.0f} m²",
+            self._format_price(data.price, data.currency),
+            *(("", desc) if desc else ()),
+            "",
+            f"{data.category} - {data.subcategory}",
+            self._offer_get(offer_type) or self._offer_get(offer_type.upper(), offer_type),
+            *((f"Tel: {phone}",) if phone else ()),
+            "",
+            f'<a href="{data.url}">View Details</a>',
+        ])
 
     def _format_price(self, price: float, currency: str) -> str:
         """Format price with currency."""
@@ -79,39 +75,14 @@ class MessageFormatter:
         formatted_price = f"{price:,.0f}"
         return f"{formatted_price} {currency}"
 
-    def _format_description(self, description: str) -> str:
-        """Format and truncate description."""
-        escaped = self._escape_html(description)
-        if len(escaped) > self.max_description_length:
-            return escaped[:self.max_description_length].rsplit(" ", 1)[0] + "..."
-        return escaped
-
-    def _format_category(self, category: str, subcategory: str) -> str:
-        """Format category information."""
-        return f"{category} - {subcategory}"
-
-    def _format_offer_type(self, offer_type: str) -> str:
-        """Format offer type."""
-        offer_text = self.OFFER_TYPE_ICONS.get(offer_type.upper(), offer_type)
-        return f"{offer_text}"
-
-    def _format_phone(self, phone: str) -> str:
-        """Format phone number."""
-        return f"Tel: {phone}"
-
-    def _format_link(self, url: str) -> str:
-        """Format the link to the listing."""
-        return f'<a href="{url}">View Details</a>'
-
     @staticmethod
     def _escape_html(text: str) -> str:
         """Escape HTML special characters."""
-        return (
-            text
-            .replace("&", "&amp;")
-            .replace("<", "&lt;")
-            .replace(">", "&gt;")
-        )
+        if "&" not in text and "<" not in text and ">" not in text:
+            return text
+        # Chained replace beats str.translate and re.sub on both short and
+        # long (non-ASCII) text, see perf/bench_escape_html.py; "&" goes first
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
 
 class ArabicMessageFormatter(MessageFormatter):
@@ -119,6 +90,8 @@ class ArabicMessageFormatter(MessageFormatter):
 
     # Unicode RTL mark for proper text direction
     RTL = "\u200F"
+    _LINE_SEP = "\n" + RTL
+    _SECTION_SEP = "\n\n" + RTL
 
     OFFER_TYPE_LABELS = {
         "SELL": "للبيع",
@@ -126,72 +99,77 @@ class ArabicMessageFormatter(MessageFormatter):
         "CHALET": "شاليه",
     }
 
+    CURRENCY_LABELS = {
+        "IQD": "د.ع",
+        "USD": "$",
+    }
+
+    def __init__(
+        self,
+        max_description_length: int = 200,
+        include_phone: bool = True,
+    ) -> None:
+        super().__init__(max_description_length, include_phone)
+        self._offer_get = self.OFFER_TYPE_LABELS.get
+
     def format(self, data: RealestateWebhook) -> str:
         """Format real estate data into an RTL Arabic Telegram message."""
-        parts = []
+        # Bind attribute lookups to locals once per message
+        esc = self._escape_html
+        maxlen = self.max_description_length
+        offer_type = data.offer_type
+        offer_label = self._offer_get(offer_type) or self._offer_get(offer_type.upper(), offer_type)
 
-        # Header: Offer type badge + Title
-        offer_label = self.OFFER_TYPE_LABELS.get(data.offer_type.upper(), data.offer_type)
-        parts.append(f"<b>【 {offer_label} 】</b>")
-        parts.append(f"🏠 <b>{self._escape_html(data.title)}</b>")
-        parts.append("")
+        # Sections are separated by a blank line and lines within a section
+        # by an RTL-prefixed newline, so every non-empty line starts with the
+        # RTL mark without a per-line concatenation.
+        line_sep = self._LINE_SEP
 
         # Location
         location = f"{data.city_name}، {data.district_name}"
         if data.subdistrict_name and data.subdistrict_name != data.district_name:
             location += f"، {data.subdistrict_name}"
-        parts.append(f"📍 {location}")
-        parts.append("")
-
-        # Price (prominent)
-        parts.append(self._format_price(data.price, data.currency))
-        parts.append("")
 
         # Specs grid
-        specs = []
-        specs.append(f"📐 المساحة: {data.area:,.0f} م²")
-
+        specs = f"📐 المساحة: {data.area:,.0f} م²"
         if data.bedrooms:
-            specs.append(f"🛏 غرف النوم: {data.bedrooms}")
+            specs += f"{line_sep}🛏 غرف النوم: {data.bedrooms}"
         if data.bathrooms:
-            specs.append(f"🚿 الحمامات: {data.bathrooms}")
+            specs += f"{line_sep}🚿 الحمامات: {data.bathrooms}"
         if data.floors:
-            specs.append(f"🏢 الطوابق: {data.floors}")
+            specs += f"{line_sep}🏢 الطوابق: {data.floors}"
         if data.age:
-            specs.append(f"📅 العمر: {data.age} سنة")
+            specs += f"{line_sep}📅 العمر: {data.age} سنة"
         if data.frontage_width and data.frontage_depth:
-            specs.append(f"📏 الواجهة: {data.frontage_width}×{data.frontage_depth} م")
-
-        parts.extend(specs)
-        parts.append("")
-
-        # Category
-        parts.append(f"🏷 {data.category} - {data.subcategory}")
+            specs += f"{line_sep}📏 الواجهة: {data.frontage_width}×{data.frontage_depth} م"
 
         # Description (if exists)
-        if data.description:
-            parts.append("")
-            desc = self._escape_html(data.description)
-            if len(desc) > self.max_description_length:
-                desc = desc[:self.max_description_length].rsplit(" ", 1)[0] + "..."
-            parts.append(f"📝 {desc}")
-
-        # Contact
-        if self.include_phone and data.phone:
-            parts.append("")
-            parts.append(f"📞 للتواصل: {data.phone}")
-
-        # Link
-        parts.append("")
-        parts.append(f'🔗 <a href="{data.url}">عرض التفاصيل في التطبيق</a>')
-
-        # Add RTL mark at the start of each line for proper Arabic display
-        return "\n".join(f"{self.RTL}{part}" if part else "" for part in parts)
+        desc = data.description
+        if desc:
+            desc = esc(desc)
+            if len(desc) > maxlen:
+                desc = desc[:maxlen].rsplit(" ", 1)[0] + "..."
+
+        phone = data.phone if self.include_phone else None
+
+        return self.RTL + self._SECTION_SEP.join([
+            # Header: Offer type badge + Title
+            f"<b>【 {offer_label} 】</b>{line_sep}🏠 <b>{esc(data.title)}</b>",
+            f"📍 {location}",
+            # Price (prominent)
+            self._format_price(data.price, data.currency),
+            specs,
+            f"🏷 {data.category} - {data.subcategory}",
+            *((f"📝 {desc}",) if desc else ()),
+            # Contact
+            *((f"📞 للتواصل: {phone}",) if phone else ()),
+            f'🔗 <a href="{data.url}">عرض التفاصيل في التطبيق</a>',
+        ])
 
     def _format_price(self, price: float, currency: str) -> str:
         """Format price with currency in Arabic."""
         if price <= 0:
             return "💰 <b>السعر عند الطلب</b>"
         formatted_price = f"{price:,.0f}"
-        currency_ar = {"IQD": "د.ع", "USD": "$"}.get(currency, currency)
+        currency_ar = self.CURRENCY_LABELS.get(currency, currency)
         return f"💰 <b>{formatted_price} {currency_ar}</b>"
@@ -0,0 +1,19 @@
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Spaces out calls so that consecutive ticks are at least `min_interval` apart."""
+
+    def __init__(self, min_interval: float) -> None:
+        self._min_interval = min_interval
+        self._next_slot = 0.0
+
+    async def tick(self) -> None:
+        """Wait until the next send slot is available."""
+        now = time.monotonic()
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
@@ -1,11 +1,20 @@
 import asyncio
+import random
+from functools import lru_cache
 from typing import Any
 
 from telegram import Bot
 from telegram.constants import ParseMode
-from telegram.error import RetryAfter, TelegramError as TelegramAPIError
+from telegram.error import (
+    BadRequest,
+    Forbidden,
+    InvalidToken,
+    RetryAfter,
+    TelegramError as TelegramAPIError,
+)
+from telegram.request import HTTPXRequest
 
-from app.core.config import settings
+from app.core.config import CITY_CHANNELS_MAP, settings
 from app.core.exceptions import (
     ChannelNotFoundError,
     TelegramError,
@@ -13,12 +22,17 @@ from app.core.exceptions import (
 )
 from app.core.logging import get_logger
 from app.schemas.realestate import RealestateWebhook
-from app.schemas.response import WebhookResponse, WebhookStatus
+from app.schemas.response import WebhookResponse
 from app.services.base import MessageService
 from app.services.message_formatter import ArabicMessageFormatter, MessageFormatter
 
 logger = get_logger(__name__)
 
+# Errors that will fail the same way on every attempt
+_NON_RETRYABLE_ERRORS = (BadRequest, Forbidden, InvalidToken)
+_MAX_BACKOFF = 30.0
+_FORMAT_CACHE_SIZE = 1024
+
 
 class TelegramService(MessageService):
     """Service for interacting with Telegram Bot API."""
@@ -32,26 +46,37 @@ class TelegramService(MessageService):
     ) -> None:
         super().__init__()
         self._bot_token = bot_token or settings.BOT_TOKEN
-        self._bot: Bot | None = None
         self._formatter = formatter or ArabicMessageFormatter()
+        # Payloads are frozen and hashable, so webhook retries and duplicate
+        # deliveries reuse the already formatted message
+        self._format_message = lru_cache(maxsize=_FORMAT_CACHE_SIZE)(
+            self._formatter.format
+        )
         self._max_retries = max_retries or settings.MAX_RETRIES
         self._retry_delay = retry_delay or settings.RETRY_DELAY
-
-    @property
-    def bot(self) -> Bot:
-        """Lazy initialization of the bot instance."""
-        if self._bot is None:
-            self._bot = Bot(token=self._bot_token)
-        return self._bot
+        # City -> channel resolver, bound once for the per-webhook lookup
+        self._channel_for_city = CITY_CHANNELS_MAP.get
+        # One pooled HTTP/2 client shared by all concurrent sends
+        request = HTTPXRequest(
+            connection_pool_size=settings.TELEGRAM_POOL_SIZE,
+            connect_timeout=5.0,
+            read_timeout=20.0,
+            http_version="2",
+        )
+        self.bot = Bot(
+            token=self._bot_token,
+            request=request,
+            get_updates_request=request,
+        )
 
     async def health_check(self) -> bool:
         """Check if the Telegram bot is accessible."""
         try:
             me = await self.bot.get_me()
-            logger.debug(f"Bot health check passed: @{me.username}")
+            logger.debug("Bot health check passed: @%s", me.username)
             return True
         except Exception as e:
-            logger.error(f"Bot health check failed: {e}")
+            logger.error("Bot health check failed: %s", e)
             return False
 
     async def send_message(
@@ -105,7 +130,7 @@ class TelegramService(MessageService):
             )
             return [msg.message_id for msg in messages]
         except Exception as e:
-            logger.error(f"Failed to send media group: {e}")
+            logger.error("Failed to send media group: %s", e)
             raise TelegramError(f"Failed to send media group: {e}")
 
     async def post_realestate(
@@ -116,24 +141,24 @@ class TelegramService(MessageService):
         """Post a real estate listing to Telegram."""
         # Get channel for city if not provided
         if channel_id is None:
-            channel_id = settings.get_channel_for_city(data.city_id)
+            channel_id = self._channel_for_city(data.city_id)
 
         if not channel_id:
-            logger.warning(f"No channel configured for city ID {data.city_id}")
+            logger.warning("No channel configured for city ID %s", data.city_id)
             return WebhookResponse(
-                status=WebhookStatus.SKIPPED,
+                status="skipped",
                 message=f"No channel configured for city ID {data.city_id}",
             )
 
         try:
-            message = self._formatter.format(data)
+            message = self._format_message(data)
             message_id: int | None = None
 
             if data.images:
                 # Send with first image
                 message_id = await self.send_photo(
                     channel_id=channel_id,
-                    photo_url=data.images[0],
+                    photo_url=str(data.images[0]),
                     caption=message,
                 )
             else:
@@ -145,39 +170,42 @@ class TelegramService(MessageService):
 
             if message_id:
                 logger.info(
-                    f"Posted realestate {data.id} to {channel_id}, message_id={message_id}"
+                    "Posted realestate %s to %s, message_id=%s",
+                    data.id,
+                    channel_id,
+                    message_id,
                 )
                 return WebhookResponse(
-                    status=WebhookStatus.POSTED,
+                    status="posted",
                     message="Successfully posted to Telegram",
                     message_id=message_id,
                     channel_id=channel_id,
                 )
             else:
                 return WebhookResponse(
-                    status=WebhookStatus.FAILED,
+                    status="failed",
                     message="Failed to post to Telegram",
                     channel_id=channel_id,
                 )
 
         except TelegramRateLimitError as e:
-            logger.warning(f"Rate limited, retry after {e.retry_after}s")
+            logger.warning("Rate limited, retry after %ss", e.retry_after)
             return WebhookResponse(
-                status=WebhookStatus.FAILED,
+                status="failed",
                 message=f"Rate limited, retry after {e.retry_after} seconds",
                 channel_id=channel_id,
             )
         except TelegramError as e:
-            logger.error(f"Telegram error: {e}")
+            logger.error("Telegram error: %s", e)
             return WebhookResponse(
-                status=WebhookStatus.FAILED,
+                status="failed",
                 message=str(e),
                 channel_id=channel_id,
             )
         except Exception as e:
-            logger.exception(f"Unexpected error posting to Telegram: {e}")
+            logger.exception("Unexpected error posting to Telegram: %s", e)
             return WebhookResponse(
-                status=WebhookStatus.FAILED,
+                status="failed",
                 message=f"Unexpected error: {str(e)}",
                 channel_id=channel_id,
             )
@@ -197,31 +225,49 @@ class TelegramService(MessageService):
 
             except RetryAfter as e:
                 logger.warning(
-                    f"Rate limited, waiting {e.retry_after}s (attempt {attempt + 1}/{self._max_retries})"
+                    "Rate limited, waiting %ss (attempt %d/%d)",
+                    e.retry_after,
+                    attempt + 1,
+                    self._max_retries,
                 )
                 if attempt < self._max_retries - 1:
                     await asyncio.sleep(e.retry_after)
                 else:
                     raise TelegramRateLimitError(e.retry_after)
 
+            except _NON_RETRYABLE_ERRORS as e:
+                logger.error("Telegram API error (not retryable): %s", e)
+                raise TelegramError(f"Telegram API error: {e}")
+
             except TelegramAPIError as e:
                 last_exception = e
                 logger.error(
-                    f"Telegram API error (attempt {attempt + 1}/{self._max_retries}): {e}"
+                    "Telegram API error (attempt %d/%d): %s",
+                    attempt + 1,
+                    self._max_retries,
+                    e,
                 )
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(self._retry_delay * (attempt + 1))
+                    await asyncio.sleep(self._backoff(attempt))
                 else:
                     raise TelegramError(f"Telegram API error: {e}")
 
             except Exception as e:
                 last_exception = e
                 logger.error(
-                    f"Unexpected error (attempt {attempt + 1}/{self._max_retries}): {e}"
+                    "Unexpected error (attempt %d/%d): %s",
+                    attempt + 1,
+                    self._max_retries,
+                    e,
                 )
                 if attempt < self._max_retries - 1:
-                    await asyncio.sleep(self._retry_delay * (attempt + 1))
+                    await asyncio.sleep(self._backoff(attempt))
 
         raise TelegramError(
             f"Failed after {self._max_retries} attempts: {last_exception}"
         )
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter for the given zero-based attempt."""
+        delay = min(self._retry_delay * (2 ** attempt), _MAX_BACKOFF)
+        return delay + random.uniform(0, 0.5)
@@ -0,0 +1,62 @@
+"""
+Micro-benchmark for the HTML escaping used by the message formatters.
+
+Compares str.translate, a regex scan (re.sub behind a re.search guard) and
+chained str.replace (the current MessageFormatter._escape_html) on clean
+and dirty listing text.
+
+    python perf/bench_escape_html.py
+"""
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.services.message_formatter import MessageFormatter  # noqa: E402
+
+_HTML_MAP = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+_HTML_TABLE = str.maketrans(_HTML_MAP)
+_HTML_RE = re.compile(r"[&<>]")
+
+
+def escape_translate(text: str) -> str:
+    """Single-pass str.translate behind a containment guard."""
+    if "&" not in text and "<" not in text and ">" not in text:
+        return text
+    return text.translate(_HTML_TABLE)
+
+
+def escape_regex(text: str) -> str:
+    """Regex substitution with an optimistic search guard."""
+    if _HTML_RE.search(text) is None:
+        return text
+    return _HTML_RE.sub(lambda m: _HTML_MAP[m.group()], text)
+
+
+CASES = {
+    "short clean": "Modern Apartment in Baghdad",
+    "short dirty": "Villa <new> & garden",
+    "long clean": "شقة حديثة واسعة بإطلالة على المدينة " * 40,
+    "long dirty": ("شقة حديثة واسعة بإطلالة على المدينة " * 20) + "<b>&</b>" + ("x " * 200),
+}
+
+IMPLEMENTATIONS = {
+    "translate": escape_translate,
+    "regex": escape_regex,
+    "replace": MessageFormatter._escape_html,
+}
+
+
+def main() -> None:
+    for case, text in CASES.items():
+        expected = MessageFormatter._escape_html(text)
+        for name, func in IMPLEMENTATIONS.items():
+            assert func(text) == expected, name
+            best = min(timeit.repeat(lambda: func(text), number=50_000, repeat=5))
+            print("%-12s %-10s %7.3f us" % (case, name, best / 50_000 * 1e6))
+
+
+if __name__ == "__main__":
+    main()
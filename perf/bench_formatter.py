@@ -0,0 +1,52 @@
+"""
+Micro-benchmark for MessageFormatter.format and ArabicMessageFormatter.format.
+
+Run before and after any change to the formatters, and against a Cython
+build (see perf/README.md) to compare compiled and pure-Python timings.
+
+    python perf/bench_formatter.py
+"""
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.schemas.realestate import RealestateWebhook  # noqa: E402
+from app.services import message_formatter  # noqa: E402
+from app.services.message_formatter import (  # noqa: E402
+    ArabicMessageFormatter,
+    MessageFormatter,
+)
+
+SAMPLE = RealestateWebhook(
+    id="abc123",
+    title="Modern Apartment",
+    description="Spacious apartment with a city view " * 8,
+    price=150000000,
+    area=180.5,
+    city_id=1,
+    city_name="Baghdad",
+    district_name="Al-Mansour",
+    subdistrict_name="Al-Jamia",
+    category="Residential",
+    subcategory="Apartment",
+    offer_type="SELL",
+    phone="+964123456789",
+    url="https://ibaity.com/realestate/abc123",
+    bedrooms=3,
+    bathrooms=2,
+    floors=1,
+    age=5,
+)
+
+
+def main() -> None:
+    print("module:", Path(message_formatter.__file__).name)
+    for formatter in (MessageFormatter(), ArabicMessageFormatter()):
+        best = min(timeit.repeat(lambda: formatter.format(SAMPLE), number=20_000, repeat=5))
+        print("%-24s %6.2f us" % (type(formatter).__name__, best / 20_000 * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Optional Cython build for hot-path modules.
+
+The application runs as plain Python; this only compiles selected modules
+in place when explicitly enabled:
+
+    BAITY_ENABLE_CYTHON=1 python setup.py build_ext --inplace
+
+Without the flag no extensions are built.
+"""
+import os
+
+from setuptools import setup
+
+CYTHON_MODULES = [
+    "app/services/message_formatter.py",
+]
+
+ext_modules = []
+if os.environ.get("BAITY_ENABLE_CYTHON") == "1":
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(CYTHON_MODULES, language_level=3)
+
+setup(
+    name="baity-telegram-bot",
+    packages=[],
+    ext_modules=ext_modules,
+)
@@ -1,78 +1,165 @@
 import os
-from typing import AsyncGenerator, Generator
-from unittest.mock import AsyncMock, MagicMock
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, AsyncGenerator, Generator, Mapping
+from unittest.mock import AsyncMock
 
+import orjson
 import pytest
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 
-# Set test environment before importing app
-os.environ["ENVIRONMENT"] = "development"
-os.environ["DEBUG"] = "true"
-os.environ["BOT_TOKEN"] = "1234567890:ABCdefGHIjklMNOpqrsTUVwxyz1234567890"
-os.environ["WEBHOOK_API_KEY"] = "test-api-key-12345678"
+TEST_ENV = {
+    "ENVIRONMENT": "development",
+    "DEBUG": "true",
+    "BOT_TOKEN": "1234567890:ABCdefGHIjklMNOpqrsTUVwxyz1234567890",
+    "WEBHOOK_API_KEY": "test-api-key-12345678",
+}
 
-from app.main import app
-from app.api.deps import get_telegram_service
-from app.services.telegram import TelegramService
 
+@dataclass(slots=True, frozen=True)
+class PostResult:
+    """Result returned by the stub service's post_realestate."""
+    status: str
+    message: str
+    message_id: int
+    channel_id: str
 
-@pytest.fixture
-def mock_telegram_service() -> MagicMock:
-    """Create a mock Telegram service."""
-    service = MagicMock(spec=TelegramService)
-    service.health_check = AsyncMock(return_value=True)
-    service.post_realestate = AsyncMock(return_value=MagicMock(
-        status="posted",
-        message="Successfully posted to Telegram",
-        message_id=12345,
-        channel_id="@test_channel",
-    ))
-    return service
 
+POST_RESULT = PostResult(
+    status="posted",
+    message="Successfully posted to Telegram",
+    message_id=12345,
+    channel_id="@test_channel",
+)
+
+# (ASGI app, wrapped FastAPI app), built once in pytest_configure
+APPS_KEY = pytest.StashKey[tuple[Any, FastAPI]]()
+TRANSPORT_KEY = pytest.StashKey[ASGITransport]()
+
+SAMPLE_REALESTATE_PAYLOAD: Mapping[str, Any] = MappingProxyType({
+    "id": "abc123xyz",
+    "title": "Modern Apartment in Baghdad",
+    "description": "Spacious 3-bedroom apartment with city view",
+    "price": 150000000,
+    "currency": "IQD",
+    "area": 180.5,
+    "city_id": 1,
+    "city_name": "Baghdad",
+    "district_name": "Al-Mansour",
+    "subdistrict_name": "Al-Jamia",
+    "category": "Residential",
+    "subcategory": "Apartment",
+    "images": ("https://example.com/image1.jpg",),
+    "offer_type": "SELL",
+    "phone": "+964123456789",
+    "url": "https://ibaity.com/realestate/abc123xyz"
+})
+
+# Two-listing batch built from the sample payload
+SAMPLE_BATCH_PAYLOAD: tuple[dict[str, Any], ...] = (
+    dict(SAMPLE_REALESTATE_PAYLOAD),
+    {**SAMPLE_REALESTATE_PAYLOAD, "id": "xyz789"},
+)
+
+# Request bodies encoded once, posted with content= instead of json=
+SAMPLE_PAYLOAD_BYTES = orjson.dumps(dict(SAMPLE_REALESTATE_PAYLOAD))
+SAMPLE_BATCH_BYTES = orjson.dumps(SAMPLE_BATCH_PAYLOAD)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Set the test environment and build the app once, before collection."""
+    os.environ.update(TEST_ENV)
+
+    from app.main import app, fastapi_app
+
+    fastapi_app.openapi()  # build and cache the schema up front
+    config.stash[APPS_KEY] = (app, fastapi_app)
+    # Unhandled app errors fail the test instead of becoming 500 responses
+    config.stash[TRANSPORT_KEY] = ASGITransport(app=app, raise_app_exceptions=True)
+
+
+@pytest.fixture(scope="session")
+def fastapi_app(pytestconfig: pytest.Config) -> FastAPI:
+    """Return the FastAPI application behind the interceptor."""
+    return pytestconfig.stash[APPS_KEY][1]
+
+
+@pytest.fixture(scope="session")
+def asgi_transport(pytestconfig: pytest.Config) -> ASGITransport:
+    """Return the in-process httpx transport bound to the ASGI app."""
+    return pytestconfig.stash[TRANSPORT_KEY]
 
-@pytest.fixture
-def client(mock_telegram_service: MagicMock) -> Generator[TestClient, None, None]:
-    """Create a test client with mocked dependencies."""
-    app.dependency_overrides[get_telegram_service] = lambda: mock_telegram_service
-    with TestClient(app) as test_client:
-        yield test_client
-    app.dependency_overrides.clear()
+
+class StubTelegramService:
+    """Stand-in for TelegramService that always succeeds without network I/O."""
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def post_realestate(self, data: Any, channel_id: str | None = None) -> Any:
+        return POST_RESULT
+
+
+@pytest.fixture(scope="session")
+def telegram_service(fastapi_app: FastAPI) -> Generator[StubTelegramService, None, None]:
+    """Install a stub Telegram service for the whole session."""
+    from app.api.deps import get_telegram_service
+
+    service = StubTelegramService()
+    fastapi_app.dependency_overrides[get_telegram_service] = lambda: service
+    yield service
+    fastapi_app.dependency_overrides.clear()
 
 
 @pytest.fixture
-async def async_client(mock_telegram_service: MagicMock) -> AsyncGenerator[AsyncClient, None]:
-    """Create an async test client with mocked dependencies."""
-    app.dependency_overrides[get_telegram_service] = lambda: mock_telegram_service
-    async with AsyncClient(app=app, base_url="http://test") as ac:
-        yield ac
-    app.dependency_overrides.clear()
+def mock_telegram_service(
+    telegram_service: StubTelegramService,
+    monkeypatch: pytest.MonkeyPatch,
+) -> StubTelegramService:
+    """Wrap the stub's methods in AsyncMocks for tests that assert on calls.
+
+    The wrappers are removed again when the test finishes.
+    """
+    for name in ("health_check", "post_realestate"):
+        method = getattr(telegram_service, name)
+        monkeypatch.setattr(telegram_service, name, AsyncMock(wraps=method))
+    return telegram_service
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client(
+    asgi_transport: ASGITransport,
+    fastapi_app: FastAPI,
+    telegram_service: StubTelegramService,
+) -> AsyncGenerator[AsyncClient, None]:
+    """Create an async test client with mocked dependencies, started once per session."""
+    # ASGITransport doesn't send lifespan events, so run startup/shutdown here
+    async with fastapi_app.router.lifespan_context(fastapi_app):
+        async with AsyncClient(transport=asgi_transport, base_url="http://test") as ac:
+            yield ac
 
 
 @pytest.fixture
 def valid_api_key() -> str:
     """Return the valid test API key."""
-    return "test-api-key-12345678"
+    return TEST_ENV["WEBHOOK_API_KEY"]
 
 
-@pytest.fixture
-def sample_realestate_payload() -> dict:
-    """Return a sample real estate webhook payload."""
-    return {
-        "id": "abc123xyz",
-        "title": "Modern Apartment in Baghdad",
-        "description": "Spacious 3-bedroom apartment with city view",
-        "price": 150000000,
-        "currency": "IQD",
-        "area": 180.5,
-        "city_id": 1,
-        "city_name": "Baghdad",
-        "district_name": "Al-Mansour",
-        "subdistrict_name": "Al-Jamia",
-        "category": "Residential",
-        "subcategory": "Apartment",
-        "images": ["https://example.com/image1.jpg"],
-        "offer_type": "SELL",
-        "phone": "+964123456789",
-        "url": "https://ibaity.com/realestate/abc123xyz"
-    }
+@pytest.fixture(scope="session")
+def sample_realestate_payload() -> Mapping[str, Any]:
+    """Return a sample real estate webhook payload (read-only, shared)."""
+    return SAMPLE_REALESTATE_PAYLOAD
+
+
+@pytest.fixture(scope="session")
+def sample_payload_bytes() -> bytes:
+    """Return the sample payload as an encoded JSON request body."""
+    return SAMPLE_PAYLOAD_BYTES
+
+
+@pytest.fixture(scope="session")
+def sample_batch_bytes() -> bytes:
+    """Return the batch payload as an encoded JSON request body."""
+    return SAMPLE_BATCH_BYTES
@@ -4,6 +4,27 @@ from app.schemas.realestate import RealestateWebhook
 from app.services.message_formatter import MessageFormatter, ArabicMessageFormatter
 
 
+@pytest.fixture(scope="module")
+def base_webhook() -> RealestateWebhook:
+    """Create minimal "Test" listing data, validated once per module."""
+    return RealestateWebhook(
+        id="test",
+        title="Test",
+        price=100000,
+        currency="IQD",
+        area=100,
+        city_id=1,
+        city_name="Test",
+        district_name="Test",
+        subdistrict_name="Test",
+        category="Test",
+        subcategory="Test",
+        images=[],
+        offer_type="SELL",
+        url="https://example.com"
+    )
+
+
 class TestMessageFormatter:
     """Test message formatting."""
 
@@ -12,9 +33,9 @@ class TestMessageFormatter:
         """Create a message formatter instance."""
         return MessageFormatter()
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_data(self) -> RealestateWebhook:
-        """Create sample real estate data."""
+        """Create sample real estate data, validated once per module."""
         return RealestateWebhook(
             id="abc123",
             title="Modern Apartment",
@@ -49,88 +70,71 @@ class TestMessageFormatter:
         assert "IQD" in message
         assert "View Details" in message
 
+    @pytest.mark.parametrize(
+        "override,contains,not_contains",
+        [
+            ({"description": "A" * 300}, "...", "A" * 201),
+            ({"price": 0}, "Price on request", "0 IQD"),
+        ],
+        ids=["truncates_description", "zero_price"],
+    )
+    def test_format_overrides(
+        self,
+        formatter: MessageFormatter,
+        base_webhook: RealestateWebhook,
+        override: dict,
+        contains: str,
+        not_contains: str,
+    ) -> None:
+        """Test formatting of single-field variations of the base listing."""
+        message = formatter.format(base_webhook.model_copy(update=override))
+
+        assert contains in message
+        assert not_contains not in message
+
     def test_format_escapes_html(
         self,
         formatter: MessageFormatter,
+        base_webhook: RealestateWebhook,
     ) -> None:
         """Test HTML escaping in titles."""
-        data = RealestateWebhook(
-            id="test",
-            title="<script>alert('xss')</script>",
-            price=100000,
-            currency="IQD",
-            area=100,
-            city_id=1,
-            city_name="Test",
-            district_name="Test",
-            subdistrict_name="Test",
-            category="Test",
-            subcategory="Test",
-            images=[],
-            offer_type="SELL",
-            url="https://example.com"
-        )
+        data = base_webhook.model_copy(update={"title": "<script>alert('xss')</script>"})
 
         message = formatter.format(data)
 
         assert "<script>" not in message
         assert "&lt;script&gt;" in message
 
-    def test_format_truncates_description(
+    # The cases below depend on validators, so they re-validate instead of
+    # using model_copy (which skips validation)
+
+    def test_validation_round_trip_keeps_raw_text(
         self,
-        formatter: MessageFormatter,
+        base_webhook: RealestateWebhook,
     ) -> None:
-        """Test description truncation."""
-        long_description = "A" * 300
-        data = RealestateWebhook(
-            id="test",
-            title="Test",
-            description=long_description,
-            price=100000,
-            currency="IQD",
-            area=100,
-            city_id=1,
-            city_name="Test",
-            district_name="Test",
-            subdistrict_name="Test",
-            category="Test",
-            subcategory="Test",
-            images=[],
-            offer_type="SELL",
-            url="https://example.com"
+        """Test that re-validating a dumped listing leaves free text unchanged."""
+        data = RealestateWebhook.model_validate(
+            {**base_webhook.model_dump(), "title": "A & B", "description": "<b>x</b>"}
         )
 
-        message = formatter.format(data)
+        assert RealestateWebhook.model_validate(data.model_dump()) == data
+        assert data.title == "A & B"
+        assert data.description == "<b>x</b>"
 
-        # Should be truncated
-        assert len([c for c in message if c == "A"]) < 300
-        assert "..." in message
-
-    def test_format_zero_price(
+    def test_format_offer_type_case_insensitive(
         self,
         formatter: MessageFormatter,
+        base_webhook: RealestateWebhook,
     ) -> None:
-        """Test formatting with zero price."""
-        data = RealestateWebhook(
-            id="test",
-            title="Test",
-            price=0,
-            currency="IQD",
-            area=100,
-            city_id=1,
-            city_name="Test",
-            district_name="Test",
-            subdistrict_name="Test",
-            category="Test",
-            subcategory="Test",
-            images=[],
-            offer_type="SELL",
-            url="https://example.com"
+        """Test offer type is normalized regardless of input case."""
+        data = RealestateWebhook.model_validate(
+            {**base_webhook.model_dump(), "offer_type": "rent"}
         )
 
         message = formatter.format(data)
 
-        assert "Price on request" in message
+        assert data.offer_type == "RENT"
+        assert "For Rent" in message
 
 
 class TestArabicMessageFormatter:
@@ -141,54 +145,25 @@ class TestArabicMessageFormatter:
         """Create an Arabic message formatter instance."""
         return ArabicMessageFormatter()
 
-    def test_arabic_price_format(
+    @pytest.mark.parametrize(
+        "override,contains,not_contains",
+        [
+            ({}, "د.ع", "IQD"),
+            ({}, "عرض التفاصيل", "View Details"),
+            ({"price": 0}, "السعر عند الطلب", "د.ع"),
+        ],
+        ids=["price_format", "link_text", "zero_price"],
+    )
+    def test_arabic_format(
         self,
         formatter: ArabicMessageFormatter,
+        base_webhook: RealestateWebhook,
+        override: dict,
+        contains: str,
+        not_contains: str,
     ) -> None:
-        """Test Arabic price formatting."""
-        data = RealestateWebhook(
-            id="test",
-            title="Test",
-            price=100000,
-            currency="IQD",
-            area=100,
-            city_id=1,
-            city_name="Test",
-            district_name="Test",
-            subdistrict_name="Test",
-            category="Test",
-            subcategory="Test",
-            images=[],
-            offer_type="SELL",
-            url="https://example.com"
-        )
-
-        message = formatter.format(data)
-
-        assert "د.ع" in message
-
-    def test_arabic_link_text(
-        self,
-        formatter: ArabicMessageFormatter,
-    ) -> None:
-        """Test Arabic link text."""
-        data = RealestateWebhook(
-            id="test",
-            title="Test",
-            price=100000,
-            currency="IQD",
-            area=100,
-            city_id=1,
-            city_name="Test",
-            district_name="Test",
-            subdistrict_name="Test",
-            category="Test",
-            subcategory="Test",
-            images=[],
-            offer_type="SELL",
-            url="https://example.com"
-        )
-
-        message = formatter.format(data)
+        """Test Arabic price and link formatting."""
+        message = formatter.format(base_webhook.model_copy(update=override))
 
-        assert "عرض التفاصيل" in message
+        assert contains in message
+        assert not_contains not in message
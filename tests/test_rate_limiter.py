@@ -0,0 +1,34 @@
+import asyncio
+import time
+
+from app.services.rate_limiter import RateLimiter
+
+
+class TestRateLimiter:
+    """Test spacing of rate limiter ticks."""
+
+    async def test_concurrent_ticks_are_spaced(self) -> None:
+        """Test that concurrent callers are released at least min_interval apart."""
+        interval = 0.05
+        limiter = RateLimiter(interval)
+        released: list[float] = []
+
+        async def tick() -> None:
+            await limiter.tick()
+            released.append(time.monotonic())
+
+        await asyncio.gather(*(tick() for _ in range(5)))
+
+        gaps = [b - a for a, b in zip(released, released[1:])]
+        assert len(gaps) == 4
+        # Small tolerance for timer resolution
+        assert all(gap >= interval * 0.9 for gap in gaps)
+
+    async def test_first_tick_does_not_wait(self) -> None:
+        """Test that an idle limiter releases the first caller immediately."""
+        limiter = RateLimiter(1.0)
+        start = time.monotonic()
+
+        await limiter.tick()
+
+        assert time.monotonic() - start < 0.1
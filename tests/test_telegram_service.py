@@ -0,0 +1,73 @@
+from typing import Any, Mapping
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from telegram.error import BadRequest, NetworkError
+
+from app.core.exceptions import TelegramError
+from app.schemas.realestate import RealestateWebhook
+from app.services.message_formatter import MessageFormatter
+from app.services.telegram import TelegramService
+
+
+class TestTelegramServiceRetry:
+    """Test retry behaviour of the Telegram service."""
+
+    @pytest.fixture
+    def service(self) -> TelegramService:
+        """Create a service with fast retries."""
+        return TelegramService(bot_token="123:test", max_retries=3, retry_delay=0.01)
+
+    async def test_bad_request_is_not_retried(
+        self,
+        service: TelegramService,
+    ) -> None:
+        """Test that permanent errors fail on the first attempt."""
+        method = AsyncMock(side_effect=BadRequest("Chat not found"))
+
+        with pytest.raises(TelegramError):
+            await service._send_with_retry(method, chat_id="@test")
+
+        assert method.await_count == 1
+
+    async def test_transient_error_is_retried(
+        self,
+        service: TelegramService,
+    ) -> None:
+        """Test that transient errors are retried until success."""
+        method = AsyncMock(side_effect=[NetworkError("timeout"), MagicMock(message_id=7)])
+
+        assert await service._send_with_retry(method, chat_id="@test") == 7
+        assert method.await_count == 2
+
+    def test_backoff_is_exponential_and_capped(
+        self,
+        service: TelegramService,
+    ) -> None:
+        """Test exponential backoff growth, jitter bound and cap."""
+        service._retry_delay = 1.0
+
+        assert 1.0 <= service._backoff(0) <= 1.5
+        assert 4.0 <= service._backoff(2) <= 4.5
+        assert 30.0 <= service._backoff(10) <= 30.5
+
+
+class TestTelegramServiceFormatCache:
+    """Test caching of formatted messages."""
+
+    async def test_duplicate_payload_is_formatted_once(
+        self,
+        sample_realestate_payload: Mapping[str, Any],
+    ) -> None:
+        """Test that a redelivered payload reuses the formatted message."""
+        formatter = MagicMock(spec=MessageFormatter)
+        formatter.format.return_value = "message"
+        service = TelegramService(bot_token="123:test", formatter=formatter)
+        service.send_photo = AsyncMock(return_value=1)
+
+        for _ in range(2):
+            data = RealestateWebhook(**sample_realestate_payload)
+            await service.post_realestate(data, channel_id="@test")
+
+        assert formatter.format.call_count == 1
+        assert service.send_photo.await_count == 2
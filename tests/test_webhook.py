@@ -1,61 +1,88 @@
+import asyncio
+import time
+from typing import Any, Mapping
+from unittest.mock import DEFAULT
+
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.api import deps
+from app.api.v1.endpoints import webhook
+from app.core.exceptions import TelegramRateLimitError
+from app.schemas.response import WebhookResponse
+from app.services.rate_limiter import RateLimiter
 
 
 class TestWebhookEndpoints:
     """Test webhook endpoints."""
 
-    def test_realestate_webhook_success(
+    async def test_realestate_webhook_success(
         self,
-        client: TestClient,
+        async_client: AsyncClient,
         valid_api_key: str,
-        sample_realestate_payload: dict,
+        sample_payload_bytes: bytes,
     ) -> None:
         """Test successful real estate webhook."""
-        response = client.post(
+        response = await async_client.post(
             "/webhook/realestate",
-            json=sample_realestate_payload,
-            headers={"X-Api-Key": valid_api_key},
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
         )
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "posted"
+        assert "X-Request-ID" in response.headers
 
-    def test_realestate_webhook_missing_api_key(
+    async def test_realestate_webhook_missing_api_key(
         self,
-        client: TestClient,
-        sample_realestate_payload: dict,
+        async_client: AsyncClient,
+        sample_payload_bytes: bytes,
     ) -> None:
         """Test webhook without API key."""
-        response = client.post(
+        response = await async_client.post(
             "/webhook/realestate",
-            json=sample_realestate_payload,
+            content=sample_payload_bytes,
+            headers={"Content-Type": "application/json"},
         )
 
         assert response.status_code == 401
 
-    def test_realestate_webhook_invalid_api_key(
+    async def test_realestate_webhook_invalid_api_key(
         self,
-        client: TestClient,
-        sample_realestate_payload: dict,
+        async_client: AsyncClient,
+        sample_payload_bytes: bytes,
     ) -> None:
         """Test webhook with invalid API key."""
-        response = client.post(
+        response = await async_client.post(
             "/webhook/realestate",
-            json=sample_realestate_payload,
-            headers={"X-Api-Key": "invalid-key"},
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": "invalid-key", "Content-Type": "application/json"},
         )
 
         assert response.status_code == 401
 
-    def test_realestate_webhook_validation_error(
+    async def test_api_key_scheme_in_openapi(self, async_client: AsyncClient) -> None:
+        """Test the X-Api-Key header is declared as a security scheme for /docs."""
+        response = await async_client.get("/openapi.json")
+
+        schema = response.json()
+        assert schema["components"]["securitySchemes"]["APIKeyHeader"] == {
+            "type": "apiKey",
+            "in": "header",
+            "name": "X-Api-Key",
+        }
+        assert {"APIKeyHeader": []} in schema["paths"]["/webhook/realestate"]["post"]["security"]
+
+    async def test_realestate_webhook_validation_error(
         self,
-        client: TestClient,
+        async_client: AsyncClient,
         valid_api_key: str,
     ) -> None:
         """Test webhook with invalid payload."""
-        response = client.post(
+        response = await async_client.post(
             "/webhook/realestate",
             json={"id": "test"},  # Missing required fields
             headers={"X-Api-Key": valid_api_key},
@@ -64,63 +91,315 @@ class TestWebhookEndpoints:
         assert response.status_code == 422
         data = response.json()
         assert "error" in data
+        assert {"field": "body.title", "message": "Field required", "code": "missing"} in data["details"]
 
-    def test_realestate_webhook_batch(
+    async def test_realestate_webhook_rate_limited(
         self,
-        client: TestClient,
+        async_client: AsyncClient,
+        mock_telegram_service: Any,
         valid_api_key: str,
-        sample_realestate_payload: dict,
+        sample_payload_bytes: bytes,
     ) -> None:
-        """Test batch webhook endpoint."""
-        payloads = [
-            sample_realestate_payload,
-            {**sample_realestate_payload, "id": "xyz789"},
-        ]
+        """Test application errors map to their status code and headers."""
+        mock_telegram_service.post_realestate.side_effect = TelegramRateLimitError(30)
+
+        response = await async_client.post(
+            "/webhook/realestate",
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+        assert response.json()["error"] == "rate_limited"
+
+    async def test_realestate_webhook_busy(
+        self,
+        async_client: AsyncClient,
+        valid_api_key: str,
+        sample_payload_bytes: bytes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test webhook returns 503 when no Telegram slot frees up in time."""
+        monkeypatch.setattr(deps, "TELEGRAM_SEM", asyncio.Semaphore(0))
+        monkeypatch.setattr(deps.settings, "TELEGRAM_ACQUIRE_TIMEOUT", 0.01)
+
+        response = await async_client.post(
+            "/webhook/realestate",
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 503
+
+    async def test_realestate_webhook_malformed_json(
+        self,
+        async_client: AsyncClient,
+        valid_api_key: str,
+    ) -> None:
+        """Test webhook with a body that isn't valid JSON."""
+        response = await async_client.post(
+            "/webhook/realestate",
+            content=b"{not json",
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
 
-        response = client.post(
+    async def test_realestate_webhook_async_queued(
+        self,
+        async_client: AsyncClient,
+        fastapi_app: FastAPI,
+        mock_telegram_service: Any,
+        valid_api_key: str,
+        sample_payload_bytes: bytes,
+    ) -> None:
+        """Test async webhook is accepted onto the posting queue."""
+        response = await async_client.post(
+            "/webhook/realestate/async",
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "queued"
+
+        await fastapi_app.state.post_queue.join()
+        mock_telegram_service.post_realestate.assert_awaited_once()
+
+    async def test_realestate_webhook_async_waits_for_busy_semaphore(
+        self,
+        async_client: AsyncClient,
+        fastapi_app: FastAPI,
+        mock_telegram_service: Any,
+        valid_api_key: str,
+        sample_payload_bytes: bytes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a queued listing is posted once a saturated semaphore frees up."""
+        monkeypatch.setattr(deps.settings, "TELEGRAM_ACQUIRE_TIMEOUT", 0.05)
+        slots = deps.settings.TELEGRAM_MAX_CONCURRENCY
+        for _ in range(slots):
+            await deps.TELEGRAM_SEM.acquire()
+        try:
+            response = await async_client.post(
+                "/webhook/realestate/async",
+                content=sample_payload_bytes,
+                headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+            )
+            assert response.json()["status"] == "queued"
+
+            # Outlast the request-path acquire timeout while every slot is held
+            await asyncio.sleep(0.1)
+            mock_telegram_service.post_realestate.assert_not_awaited()
+        finally:
+            for _ in range(slots):
+                deps.TELEGRAM_SEM.release()
+
+        await fastapi_app.state.post_queue.join()
+        mock_telegram_service.post_realestate.assert_awaited_once()
+
+    async def test_realestate_webhook_async_queue_full(
+        self,
+        async_client: AsyncClient,
+        fastapi_app: FastAPI,
+        valid_api_key: str,
+        sample_payload_bytes: bytes,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test async webhook is rejected when the posting queue is full."""
+        full_queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        full_queue.put_nowait(None)
+        monkeypatch.setattr(fastapi_app.state, "post_queue", full_queue)
+
+        response = await async_client.post(
+            "/webhook/realestate/async",
+            content=sample_payload_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 503
+
+    async def test_realestate_webhook_batch(
+        self,
+        async_client: AsyncClient,
+        valid_api_key: str,
+        sample_batch_bytes: bytes,
+    ) -> None:
+        """Test batch webhook endpoint."""
+        response = await async_client.post(
             "/webhook/realestate/batch",
-            json=payloads,
-            headers={"X-Api-Key": valid_api_key},
+            content=sample_batch_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
         )
 
         assert response.status_code == 200
         data = response.json()
         assert len(data) == 2
 
+    async def test_realestate_webhook_batch_isolates_failures(
+        self,
+        async_client: AsyncClient,
+        mock_telegram_service: Any,
+        valid_api_key: str,
+        sample_batch_bytes: bytes,
+    ) -> None:
+        """Test a failing batch item doesn't affect the others."""
+        # DEFAULT falls through to the wrapped stub, which reports success
+        mock_telegram_service.post_realestate.side_effect = [RuntimeError("boom"), DEFAULT]
+
+        response = await async_client.post(
+            "/webhook/realestate/batch",
+            content=sample_batch_bytes,
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["status"] for item in data] == ["failed", "posted"]
+
+    async def test_realestate_webhook_batch_ordering_and_concurrency(
+        self,
+        async_client: AsyncClient,
+        mock_telegram_service: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        valid_api_key: str,
+        sample_realestate_payload: Mapping[str, Any],
+    ) -> None:
+        """Test batch results keep request order and posts stay under the cap."""
+        monkeypatch.setattr(webhook, "_batch_semaphore", asyncio.Semaphore(2))
+        monkeypatch.setattr(webhook, "_rate_limiter", RateLimiter(0))
+        in_flight = max_in_flight = 0
+
+        async def post(data: Any, channel_id: str | None = None) -> Any:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                # Later items finish first so ordering can't come from completion
+                await asyncio.sleep(0.01 * (5 - int(data.id)))
+                if data.id == "2":
+                    raise RuntimeError("boom")
+                return WebhookResponse(status="posted", message=data.id)
+            finally:
+                in_flight -= 1
+
+        mock_telegram_service.post_realestate.side_effect = post
+        payloads = [{**sample_realestate_payload, "id": str(i)} for i in range(5)]
+
+        response = await async_client.post(
+            "/webhook/realestate/batch",
+            content=orjson.dumps(payloads),
+            headers={"X-Api-Key": valid_api_key, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["message"] for item in data] == ["0", "1", "boom", "3", "4"]
+        assert data[2]["status"] == "failed"
+        assert max_in_flight == 2
+
 
 class TestHealthEndpoints:
     """Test health check endpoints."""
 
-    def test_health_check(self, client: TestClient) -> None:
-        """Test main health endpoint."""
-        response = client.get("/api/v1/health")
+    @pytest.mark.parametrize(
+        "path,key,value",
+        [
+            ("/api/v1/health", "status", {"ok", "degraded"}),
+            ("/api/v1/health/ready", "status", "ready"),
+            ("/api/v1/health/live", "status", "alive"),
+            ("/health", "status", "ok"),
+        ],
+        ids=["health", "readiness", "liveness", "legacy"],
+    )
+    async def test_health_endpoints(
+        self,
+        async_client: AsyncClient,
+        path: str,
+        key: str,
+        value: str | set[str],
+    ) -> None:
+        """Test health, probe and legacy endpoints report their status."""
+        response = await async_client.get(path)
 
         assert response.status_code == 200
         data = response.json()
-        assert data["status"] in ["ok", "degraded"]
+        if isinstance(value, set):
+            assert data[key] in value
+        else:
+            assert data[key] == value
+
+    async def test_health_check_details(self, async_client: AsyncClient) -> None:
+        """Test main health endpoint reports version and checks, untraced."""
+        response = await async_client.get("/api/v1/health")
+
+        data = response.json()
         assert "version" in data
         assert "checks" in data
+        assert "X-Request-ID" not in response.headers
 
-    def test_readiness_check(self, client: TestClient) -> None:
-        """Test readiness endpoint."""
-        response = client.get("/api/v1/health/ready")
+    async def test_health_like_path_is_traced(self, async_client: AsyncClient) -> None:
+        """Test only exact health paths skip request logging."""
+        response = await async_client.get("/healthz")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ready"
+        assert "X-Request-ID" in response.headers
+
+    async def test_health_check_is_cached(
+        self,
+        async_client: AsyncClient,
+        mock_telegram_service: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test Telegram connectivity is checked once per cache TTL."""
+        monkeypatch.setattr(deps, "_health_cache", deps._HealthCache())
 
-    def test_liveness_check(self, client: TestClient) -> None:
-        """Test liveness endpoint."""
-        response = client.get("/api/v1/health/live")
+        await async_client.get("/api/v1/health")
+        await async_client.get("/api/v1/health")
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "alive"
+        assert mock_telegram_service.health_check.await_count == 1
 
-    def test_legacy_health_endpoint(self, client: TestClient) -> None:
-        """Test legacy health endpoint."""
-        response = client.get("/health")
+    async def test_health_check_serves_stale_result_during_refresh(
+        self,
+        mock_telegram_service: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test concurrent callers get the last result while an expired entry refreshes."""
+        expired = deps._HealthCache(
+            checked_at=time.monotonic() - deps.settings.HEALTH_CACHE_TTL - 1,
+            healthy=True,
+        )
+        monkeypatch.setattr(deps, "_health_cache", expired)
+
+        async def slow_health_check() -> bool:
+            await asyncio.sleep(0.05)
+            return False
+
+        mock_telegram_service.health_check.side_effect = slow_health_check
+
+        refresh = asyncio.create_task(deps.cached_telegram_health(mock_telegram_service))
+        await asyncio.sleep(0)
+        # Returns without waiting for the in-flight check
+        stale = await asyncio.wait_for(
+            deps.cached_telegram_health(mock_telegram_service),
+            timeout=0.01,
+        )
+
+        assert stale is True
+        assert await refresh is False
+        assert mock_telegram_service.health_check.await_count == 1
+
+    async def test_probe_alias_endpoint(self, async_client: AsyncClient) -> None:
+        """Test unprefixed probe endpoints answered by the interceptor."""
+        response = await async_client.get("/health/live")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "ok"
+        assert response.json() == {"status": "alive"}
+
+    async def test_probe_method_not_allowed(self, async_client: AsyncClient) -> None:
+        """Test non-GET probe requests are rejected."""
+        response = await async_client.post("/api/v1/health/ready")
+
+        assert response.status_code == 405
+        assert response.headers["allow"] == "GET"